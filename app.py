@@ -2,8 +2,10 @@
 Streamlit application entry: Cruising Speed Analysis Tool
 """
 
+import hashlib
 from parser import FitParser
 
+import pandas as pd
 import streamlit as st
 
 import config
@@ -12,6 +14,11 @@ from compute import create_calculator
 from models import RideData
 from preprocess import PreProcessingPipeline
 
+# Enable Copy-on-Write so derived DataFrames never silently mutate their parent
+# (always on, and no longer configurable, from pandas 3.0)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
 # Set page configuration
 st.set_page_config(
     page_title="Cruising Speed Analysis Tool",
@@ -20,6 +27,40 @@ st.set_page_config(
 )
 
 
+# Configuration keys only used by the calculators, not by preprocessing
+CALCULATOR_CONFIG_KEYS = ('np_window_size_seconds', 'np_exponent', 'ftp')
+
+# Columns read by the charts; only these are hashed to key the chart cache
+CHART_COLUMNS = ('timestamp', 'speed_kmh', 'is_cruising', 'power')
+
+
+@st.cache_data(show_spinner=False)
+def _parse_and_preprocess(bytes_data, preprocess_conf):
+    """
+    Parse FIT data and run the preprocessing pipeline, cached on file content and configuration
+
+    Args:
+        bytes_data (bytes): Raw FIT file data
+        preprocess_conf (tuple): Sorted (key, value) pairs of the preprocessing configuration
+
+    Returns:
+        tuple: (original data point count, processed RideData), or None if parsing fails
+    """
+    # Parse FIT data
+    parser = FitParser()
+    ride_data = parser.parse_bytes(bytes_data)
+
+    if ride_data is None:
+        return None
+
+    # Preprocess data
+    conf = dict(preprocess_conf)
+    pipeline = PreProcessingPipeline.create_default_pipeline(conf)
+    processed_data = pipeline.process(ride_data, conf)
+
+    return len(ride_data), processed_data
+
+
 def process_uploaded_file(uploaded_file, user_config):
     """
     Process the uploaded FIT file and calculate cruising speed
@@ -35,55 +76,91 @@ def process_uploaded_file(uploaded_file, user_config):
         # Read uploaded file data
         bytes_data = uploaded_file.getvalue()
 
-        # Parse FIT data
-        parser = FitParser()
-        ride_data = parser.parse_bytes(bytes_data)
-
-        if ride_data is None:
-            return {"success": False, "message": "Failed to parse FIT file data"}, None
-
-        # Display original data point count
-        st.info(f"Original data points: {len(ride_data.records)}")
-
         # Merge configurations
         conf = config.merge_config(
             config.get_default_config(),
             user_config
         )
 
-        # Preprocess data
-        pipeline = PreProcessingPipeline.create_default_pipeline()
-        processed_data = pipeline.process(ride_data, conf)
+        # Parse and preprocess, reusing cached results when only calculator settings change
+        preprocess_conf = tuple(sorted(
+            (key, value) for key, value in conf.items()
+            if key not in CALCULATOR_CONFIG_KEYS
+        ))
+        parsed = _parse_and_preprocess(bytes_data, preprocess_conf)
+
+        if parsed is None:
+            return {"success": False, "message": "Failed to parse FIT file data"}, None
+
+        original_points, processed_data = parsed
+
+        # Display original data point count
+        st.info(f"Original data points: {original_points}")
 
         # Calculate cruising speed
         cruising_calculator = create_calculator('cruising_speed', conf)
         cruising_result = cruising_calculator.calculate(processed_data)
         
-        # Calculate normalized power if configuration available
-        np_calculator = create_calculator('normalized_power', conf)
-        np_result = np_calculator.calculate(processed_data)
-        
-        # Merge results
-        result = {**cruising_result}
-        
-        # Only merge NP results if they were successful
-        if np_result.get('success', False):
-            result.update({
-                'normalized_power': np_result.get('normalized_power'),
-                'intensity_factor': np_result.get('intensity_factor'),
-                'np_to_avg_ratio': np_result.get('np_to_avg_ratio'),
-            })
+        # Calculate normalized power only if the ride recorded any power data
+        # (rides without power have no 'power' column)
+        np_result = (
+            create_calculator('normalized_power', conf).calculate(processed_data)
+            if 'power' in processed_data.columns else {}
+        )
 
-        # Convert to DataFrame for visualization
-        df = processed_data.to_dataframe()
+        # Merge results, including NP results only if they were successful
+        result = cruising_result if not np_result.get('success', False) else {
+            **cruising_result,
+            'normalized_power': np_result['normalized_power'],
+            'intensity_factor': np_result['intensity_factor'],
+            'np_to_avg_ratio': np_result['np_to_avg_ratio'],
+        }
 
-        return result, df
+        # DataFrame for visualization (shares the processed arrays, no copy)
+        return result, processed_data.to_dataframe()
 
     except Exception as e:
         st.error(f"Error processing file: {str(e)}")
         return {"success": False, "message": f"Processing error: {str(e)}"}, None
 
 
+def _chart_data_key(df):
+    """
+    Content key of the chart data, computed once per render
+
+    Args:
+        df (pd.DataFrame): Processed DataFrame
+
+    Returns:
+        str: Digest of the row hashes of the charted columns
+    """
+    columns = [col for col in CHART_COLUMNS if col in df.columns]
+    row_hashes = pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+    return hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _create_chart(chart_name, data_key, _df, result=None, downsample_column=None):
+    """
+    Create a visualization chart, cached on the chart data key and results
+
+    Args:
+        chart_name (str): Name of the chart function in the visualization module
+        data_key (str): Content key of the chart data (see _chart_data_key)
+        _df (pd.DataFrame): Processed DataFrame (not hashed by Streamlit)
+        result (dict, optional): Calculation results, for charts that use them
+        downsample_column (str, optional): Column whose shape a downsampled copy
+            of the data keeps (timeline charts); only computed on a cache miss
+
+    Returns:
+        plotly.graph_objects.Figure: Chart figure
+    """
+    if downsample_column is not None:
+        _df = visualization.downsample(_df, config.CHART_MAX_POINTS, downsample_column)
+    create = getattr(visualization, chart_name)
+    return create(_df) if result is None else create(_df, result)
+
+
 def show_results(result, df):
     """
     Display calculation results and visualizations
@@ -96,6 +173,10 @@ def show_results(result, df):
         st.error(f"Calculation failed: {result.get('message', 'Unknown error')}")
         return
     
+    # Hash the chart data once instead of once per chart (timeline charts
+    # downsample df inside the cached call, distributions keep the full data)
+    data_key = _chart_data_key(df)
+
     # Create tabs for different types of analysis
     tab1, tab2 = st.tabs(["Speed Analysis", "Power Analysis"])
     
@@ -116,16 +197,17 @@ def show_results(result, df):
 
         # Display ride overview
         st.subheader("Ride Overview")
-        summary_chart = visualization.create_summary_charts(df, result)
+        summary_chart = _create_chart('create_summary_charts', data_key, df, result)
         st.plotly_chart(summary_chart, use_container_width=True)
 
         # Display charts
         st.subheader("Speed Timeline")
-        speed_chart = visualization.create_speed_time_chart(df)
+        speed_chart = _create_chart('create_speed_time_chart', data_key, df,
+                                    downsample_column='speed_kmh')
         st.plotly_chart(speed_chart, use_container_width=True)
 
         st.subheader("Speed Distribution")
-        dist_chart = visualization.create_speed_distribution(df)
+        dist_chart = _create_chart('create_speed_distribution', data_key, df)
         st.plotly_chart(dist_chart, use_container_width=True)
     
     with tab2:
@@ -145,11 +227,12 @@ def show_results(result, df):
             
             # Display power charts
             st.subheader("Power Analysis")
-            power_chart = visualization.create_power_analysis_chart(df, result)
+            power_chart = _create_chart('create_power_analysis_chart', data_key, df, result,
+                                        downsample_column='power')
             st.plotly_chart(power_chart, use_container_width=True)
             
             st.subheader("Power Distribution")
-            power_dist_chart = visualization.create_power_distribution(df, result)
+            power_dist_chart = _create_chart('create_power_distribution', data_key, df, result)
             st.plotly_chart(power_dist_chart, use_container_width=True)
         else:
             st.warning("No power data detected. Normalized Power cannot be calculated.")
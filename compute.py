@@ -2,17 +2,53 @@
 Computation module: Implements cruising speed calculation logic
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 import config
 from models import RideData
 
 
+def _as_arrays(data: Union[RideData, pd.DataFrame, Mapping[str, np.ndarray]]) -> Mapping[str, np.ndarray]:
+    """Return the data columns as NumPy arrays, without building a DataFrame"""
+    if isinstance(data, RideData):
+        return data.as_arrays()
+    if isinstance(data, pd.DataFrame):
+        return {column: data[column].to_numpy() for column in data.columns}
+    return data
+
+
+def _masked_weighted_sums(values: np.ndarray, weights: np.ndarray,
+                          cruising_mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Weighted column sums, ignoring missing values
+
+    Args:
+        values (np.ndarray): (N, M) matrix of metric values, NaN if missing
+        weights (np.ndarray): N weights, zero outside the cruising segments
+        cruising_mask (np.ndarray): N booleans marking cruising points
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: M weighted sums, and whether each metric
+            has any valid cruising sample
+    """
+    valid = ~np.isnan(values)
+    has_samples = (valid & cruising_mask[:, np.newaxis]).any(axis=0)
+    return weights @ np.where(valid, values, 0.0), has_samples
+
+
 class CruisingSpeedCalculator:
     """Cruising speed calculator"""
 
+    # Metrics averaged over the cruising segments when present in the data
+    OPTIONAL_METRICS = ('power', 'cadence', 'heart_rate')
+
+    __slots__ = ('config', 'debug')
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the calculator
@@ -21,110 +57,181 @@ class CruisingSpeedCalculator:
             config (Dict[str, Any], optional): Configuration parameters
         """
         self.config = config if config is not None else {}
+        self._resolve_config()
+
+    def _resolve_config(self) -> None:
+        """Resolve configuration parameters once, falling back to module defaults"""
+        self.debug = self.config.get('debug', config.DEBUG)
 
-    def calculate(self, data: RideData) -> Dict[str, Any]:
+    def calculate(self, data: Union[RideData, pd.DataFrame, Mapping[str, np.ndarray]]) -> Dict[str, Any]:
         """
         Calculate cruising speed and related metrics
 
         Args:
-            data (RideData): Processed data
+            data (Union[RideData, pd.DataFrame, Mapping[str, np.ndarray]]): Processed data,
+                its DataFrame, or its columns as NumPy arrays
 
         Returns:
             Dict[str, Any]: Calculation results, including cruising speed and other metrics
         """
-        df = data.to_dataframe()
+        arrays = _as_arrays(data)
 
-        # Extract cruising data
-        cruising_data = df[df['is_cruising']].copy()
+        # Extract cruising mask as a NumPy array (no sub-DataFrame copy)
+        cruising_mask = np.asarray(arrays['is_cruising'], dtype=bool)
 
-        if cruising_data.empty:
+        if not cruising_mask.any():
             print("Warning: No cruising data segments identified with current thresholds.")
-            self._print_debug_info(df)
+            self._print_debug_info(arrays)
             return {
                 'cruising_speed': None,
                 'success': False,
                 'message': 'No cruising data identified'
             }
 
+        cruising_points = int(cruising_mask.sum())
+
+        # Masked time weights: non-cruising points get zero weight, so every
+        # reduction below runs over full contiguous columns without gathering
+        time_diff = np.asarray(arrays['time_diff_seconds'], dtype=np.float64)
+        weights = np.where(cruising_mask, np.nan_to_num(time_diff), 0.0)
+        speed = np.asarray(arrays['speed_kmh'], dtype=np.float64)
+        avg_speed = np.dot(speed, cruising_mask) / cruising_points
+
         # Calculate total cruising time
-        cruising_total_time_seconds = cruising_data['time_diff_seconds'].sum()
+        cruising_total_time_seconds = weights.sum()
 
         if cruising_total_time_seconds <= 0:
             print("Warning: Total cruising time is zero or negative, cannot calculate weighted average speed.")
             return {
                 'cruising_speed': None,
-                'avg_speed': cruising_data['speed_kmh'].mean() if not cruising_data.empty else None,
+                'avg_speed': avg_speed,
                 'success': False,
                 'message': 'Abnormal total cruising time'
             }
 
-        # Calculate time-weighted cruising speed
-        weighted_cruising_speed_kmh = (
-            cruising_data['speed_kmh'] * cruising_data['time_diff_seconds']
-        ).sum() / cruising_total_time_seconds
+        # Calculate all time-weighted means (speed and optional metrics) at once
+        weighted_means = self._weighted_means(arrays, cruising_mask, weights, cruising_total_time_seconds)
+
+        # Speed is left out when no cruising point has a valid speed sample
+        if 'speed_kmh' not in weighted_means:
+            print("Warning: No valid speed samples in cruising segments, cannot calculate weighted average speed.")
+            return {
+                'cruising_speed': None,
+                'avg_speed': avg_speed,
+                'success': False,
+                'message': 'No valid speed data in cruising segments'
+            }
 
         # Prepare results
         result = {
-            'cruising_speed': weighted_cruising_speed_kmh,
-            'avg_speed': cruising_data['speed_kmh'].mean(),
-            'cruising_points': len(cruising_data),
-            'total_points': len(df),
+            'cruising_speed': weighted_means.pop('speed_kmh'),
+            'avg_speed': avg_speed,
+            'cruising_points': cruising_points,
+            'total_points': len(cruising_mask),
             'cruising_time_seconds': cruising_total_time_seconds,
             'success': True
         }
 
-        # Add optional metrics
-        self._add_optional_metrics(result, cruising_data, cruising_total_time_seconds)
+        # Add optional metrics (e.g., power, cadence, heart rate)
+        result.update({f'avg_{column}': mean for column, mean in weighted_means.items()})
 
         return result
 
-    def _add_optional_metrics(self, result: Dict[str, Any],
-                             cruising_data: pd.DataFrame,
-                             cruising_total_time_seconds: float) -> None:
-        """Add optional calculated metrics (e.g., power, cadence)"""
-
-        # Calculate average cruising power (if available)
-        if 'power' in cruising_data.columns and cruising_data['power'].notna().any():
-            result['avg_power'] = (
-                cruising_data['power'] * cruising_data['time_diff_seconds']
-            ).sum() / cruising_total_time_seconds
-
-        # Calculate average cruising cadence (if available)
-        if 'cadence' in cruising_data.columns and cruising_data['cadence'].notna().any():
-            result['avg_cadence'] = (
-                cruising_data['cadence'] * cruising_data['time_diff_seconds']
-            ).sum() / cruising_total_time_seconds
-
-        # Calculate average cruising heart rate (if available)
-        if 'heart_rate' in cruising_data.columns and cruising_data['heart_rate'].notna().any():
-            result['avg_heart_rate'] = (
-                cruising_data['heart_rate'] * cruising_data['time_diff_seconds']
-            ).sum() / cruising_total_time_seconds
-
-    def _print_debug_info(self, df: pd.DataFrame) -> None:
-        """Print debug information"""
+    def _weighted_means(self, arrays: Mapping[str, np.ndarray],
+                        cruising_mask: np.ndarray,
+                        weights: np.ndarray,
+                        cruising_total_time_seconds: float) -> Dict[str, float]:
+        """
+        Calculate time-weighted means of speed and the optional metrics
+
+        All columns are stacked into one matrix so the weights are applied in a
+        single matrix-vector product. Missing samples contribute nothing to the
+        weighted sums; metrics without any valid cruising sample are left out.
+        """
+        columns = ['speed_kmh'] + [c for c in self.OPTIONAL_METRICS if c in arrays]
+        values = np.column_stack([np.asarray(arrays[c], dtype=np.float64) for c in columns])
+
+        workers = config.parallel_workers(len(values))
+        if workers > 1:
+            # Long rides: reduce row chunks in threads (NumPy releases the GIL)
+            bounds = np.linspace(0, len(values), workers + 1, dtype=int)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                partials = list(executor.map(
+                    lambda start, stop: _masked_weighted_sums(
+                        values[start:stop], weights[start:stop], cruising_mask[start:stop]
+                    ),
+                    bounds[:-1], bounds[1:]
+                ))
+            sums = np.sum([partial[0] for partial in partials], axis=0)
+            has_samples = np.any([partial[1] for partial in partials], axis=0)
+        else:
+            sums, has_samples = _masked_weighted_sums(values, weights, cruising_mask)
+
+        means = sums / cruising_total_time_seconds
+
+        return {
+            column: mean
+            for column, mean, present in zip(columns, means, has_samples)
+            if present
+        }
+
+    def _print_debug_info(self, arrays: Mapping[str, np.ndarray]) -> None:
+        """Print debug information (only when the 'debug' option is enabled)"""
+        if not self.debug:
+            return
+
+        speed = np.asarray(arrays['speed_kmh'], dtype=np.float64)
+        stopped = np.asarray(arrays['is_stopped'], dtype=bool)
+
         print("\nData overview (for threshold debugging):")
-        print(f"  Overall average speed (km/h): {df['speed_kmh'].mean():.2f}")
-        print(f"  Max speed (km/h): {df['speed_kmh'].max():.2f}")
-        print(f"  Min speed (km/h): {df['speed_kmh'].min():.2f}")
+        print(f"  Overall average speed (km/h): {speed.mean():.2f}")
+        print(f"  Max speed (km/h): {speed.max():.2f}")
+        print(f"  Min speed (km/h): {speed.min():.2f}")
 
-        if not df[df['is_stopped']].empty:
-            print(f"  Average speed of 'stopped' points (km/h): {df[df['is_stopped']]['speed_kmh'].mean():.2f}")
+        if stopped.any():
+            print(f"  Average speed of 'stopped' points (km/h): {speed[stopped].mean():.2f}")
 
-        print(f"  Maximum absolute acceleration (m/s^2): {df['acceleration'].abs().max():.2f}")
+        acceleration = np.asarray(arrays['acceleration'], dtype=np.float64)
+        print(f"  Maximum absolute acceleration (m/s^2): {np.abs(acceleration).max():.2f}")
 
-        if 'speed_rolling_std_kmh' in df.columns:
-            print(f"  Maximum speed rolling standard deviation (km/h): {df['speed_rolling_std_kmh'].max():.2f}")
+        if 'speed_rolling_std_kmh' in arrays:
+            print(f"  Maximum speed rolling standard deviation (km/h): {np.max(arrays['speed_rolling_std_kmh']):.2f}")
 
-        if 'power' in df.columns and df['power'].notna().any():
-            print(f"  Overall average power (W): {df['power'].mean():.2f}")
-            print(f"  Max power (W): {df['power'].max():.2f}")
-            print(f"  Min power (W): {df['power'].min():.2f}")
+        if 'power' in arrays:
+            power = np.asarray(arrays['power'], dtype=np.float64)
+            if not np.isnan(power).all():
+                print(f"  Overall average power (W): {np.nanmean(power):.2f}")
+                print(f"  Max power (W): {np.nanmax(power):.2f}")
+                print(f"  Min power (W): {np.nanmin(power):.2f}")
+
+
+def _centered_window_sums(values: np.ndarray, window_points: int) -> np.ndarray:
+    """
+    Sum values over centered rolling windows using prefix sums
+
+    Uses the same window alignment as pandas rolling(window_points, center=True),
+    with windows truncated at the edges (as with min_periods=1).
+
+    Args:
+        values (np.ndarray): Values to sum
+        window_points (int): Rolling window size in data points
+
+    Returns:
+        np.ndarray: Window sums, one per input value
+    """
+    n = values.shape[0]
+    prefix = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+    index = np.arange(n)
+    start = np.maximum(index - window_points // 2, 0)
+    stop = np.minimum(index + (window_points - 1) // 2 + 1, n)
+    return prefix[stop] - prefix[start]
 
 
 class NormalizedPowerCalculator:
     """Normalized Power (NP) calculator"""
 
+    __slots__ = ('config', 'window_size', 'exponent', 'ftp')
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the calculator
@@ -133,39 +240,58 @@ class NormalizedPowerCalculator:
             config (Dict[str, Any], optional): Configuration parameters
         """
         self.config = config if config is not None else {}
+        self._resolve_config()
 
-    def calculate(self, data: RideData) -> Dict[str, Any]:
+    def _resolve_config(self) -> None:
+        """Resolve configuration parameters once, falling back to module defaults"""
+        self.window_size = self.config.get('np_window_size_seconds', config.NP_WINDOW_SIZE_SECONDS)
+        self.exponent = self.config.get('np_exponent', config.NP_EXPONENT)
+        ftp = self.config.get('ftp')
+        self.ftp = ftp if ftp is not None and ftp > 0 else None
+
+    def calculate(self, data: Union[RideData, pd.DataFrame, Mapping[str, np.ndarray]]) -> Dict[str, Any]:
         """
         Calculate Normalized Power (NP) and related metrics
 
         Args:
-            data (RideData): Processed ride data
+            data (Union[RideData, pd.DataFrame, Mapping[str, np.ndarray]]): Processed ride data,
+                its DataFrame, or its columns as NumPy arrays
 
         Returns:
             Dict[str, Any]: Calculation results, including NP and other metrics
         """
-        df = data.to_dataframe()
+        arrays = _as_arrays(data)
         
-        # Check if power data exists
-        if 'power' not in df.columns or df['power'].isna().all():
+        # Check if power data exists (the validity mask is reused below)
+        power = np.asarray(arrays['power'], dtype=np.float64) if 'power' in arrays else np.empty(0)
+        valid = ~np.isnan(power)
+        if not valid.any():
             return {
                 'normalized_power': None,
                 'success': False,
                 'message': 'No power data available'
             }
             
-        # Get configuration parameters
-        window_size = self.config.get('np_window_size_seconds', config.NP_WINDOW_SIZE_SECONDS)
-        exponent = self.config.get('np_exponent', config.NP_EXPONENT)
+        # Configuration parameters (resolved at initialization)
+        window_size = self.window_size
+        exponent = self.exponent
         
+        # Zero-copy views of the columns used below
+        power_filled = np.where(valid, power, 0.0)
+        time_diff = (
+            np.asarray(arrays['time_diff_seconds'], dtype=np.float64)
+            if 'time_diff_seconds' in arrays else None
+        )
+
         # Calculate time-weighted average power for reference
-        if 'time_diff_seconds' in df.columns and df['time_diff_seconds'].sum() > 0:
-            avg_power = (df['power'] * df['time_diff_seconds']).sum() / df['time_diff_seconds'].sum()
+        total_time_seconds = np.nansum(time_diff) if time_diff is not None else 0.0
+        if total_time_seconds > 0:
+            avg_power = np.dot(power_filled, np.nan_to_num(time_diff)) / total_time_seconds
         else:
-            avg_power = df['power'].mean()
+            avg_power = power[valid].mean()
             
         # Handle short rides
-        if len(df) < window_size:
+        if len(power) < window_size:
             return {
                 'normalized_power': None, 
                 'avg_power': avg_power,
@@ -173,30 +299,32 @@ class NormalizedPowerCalculator:
                 'message': f'Ride too short for NP calculation (minimum {window_size}s)'
             }
             
-        # Step 1: Calculate rolling average with specified window size
-        mean_time_diff = df['time_diff_seconds'].mean() if 'time_diff_seconds' in df.columns else 1.0
+        # Convert the window size from seconds to data points
+        mean_time_diff = np.nanmean(time_diff) if time_diff is not None else 1.0
         window_points = max(1, int(window_size / mean_time_diff))
         
-        # Calculate rolling average power
-        df['power_30s_avg'] = df['power'].rolling(
-            window=window_points, 
-            min_periods=1, 
-            center=True
-        ).mean()
-        
-        # Step 2: Raise to 4th power
-        df['power_30s_avg_4th'] = df['power_30s_avg'] ** exponent
-        
-        # Step 3: Calculate average of 4th power values
-        avg_4th_power = df['power_30s_avg_4th'].mean()
+        # Step 1: Rolling average over the valid samples of each window
+        window_sums = _centered_window_sums(power_filled, window_points)
+        window_counts = _centered_window_sums(valid, window_points)
+        has_samples = window_counts > 0
+        rolling_avg = (window_sums[has_samples] / window_counts[has_samples]).astype(np.float32)
+
+        # Step 2: Raise to 4th power (float32 is ample for watts and halves the bandwidth)
+        if exponent == 4:
+            # Two multiplies instead of a pow() call per sample
+            squared = rolling_avg * rolling_avg
+            powered = squared * squared
+        else:
+            powered = rolling_avg ** exponent
+
+        # Step 3: Average, accumulating in float64 to keep the final digits
+        avg_4th_power = float(np.mean(powered, dtype=np.float64))
         
         # Step 4: Take 4th root
         normalized_power = avg_4th_power ** (1/exponent)
         
         # Calculate Intensity Factor (IF) if FTP is available
-        intensity_factor = None
-        if 'ftp' in self.config and self.config['ftp'] is not None and self.config['ftp'] > 0:
-            intensity_factor = normalized_power / self.config['ftp']
+        intensity_factor = normalized_power / self.ftp if self.ftp is not None else None
             
         # Prepare results
         result = {
@@ -210,11 +338,27 @@ class NormalizedPowerCalculator:
         return result
 
 
+# Calculator classes by type name
+CALCULATOR_TYPES = {
+    'cruising_speed': CruisingSpeedCalculator,
+    'normalized_power': NormalizedPowerCalculator,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_calculator(calculator_type: str, config_items: Optional[Tuple[Tuple[str, Any], ...]]):
+    """Create a calculator for a frozen configuration, reused across Streamlit reruns"""
+    return CALCULATOR_TYPES[calculator_type](dict(config_items) if config_items is not None else None)
+
+
 # Factory function to create different types of calculators
 def create_calculator(calculator_type='cruising_speed', config=None):
     """
     Create a calculator instance
 
+    Instances are cached per type and configuration, so repeated analyses with
+    the same settings reuse the same calculator.
+
     Args:
         calculator_type (str): Type of calculator
         config (Dict[str, Any], optional): Configuration parameters
@@ -222,9 +366,14 @@ def create_calculator(calculator_type='cruising_speed', config=None):
     Returns:
         Calculator instance
     """
-    if calculator_type == 'cruising_speed':
-        return CruisingSpeedCalculator(config)
-    elif calculator_type == 'normalized_power':
-        return NormalizedPowerCalculator(config)
-    else:
-        raise ValueError(f"Unsupported calculator type: {calculator_type}")
\ No newline at end of file
+    if calculator_type not in CALCULATOR_TYPES:
+        raise ValueError(f"Unsupported calculator type: {calculator_type}")
+
+    config_items = tuple(sorted(config.items())) if config is not None else None
+    try:
+        hash(config_items)
+    except TypeError:
+        # Unhashable configuration values cannot be cached
+        return CALCULATOR_TYPES[calculator_type](config)
+
+    return _cached_calculator(calculator_type, config_items)
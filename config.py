@@ -2,6 +2,10 @@
 Configuration module: Stores all adjustable parameters
 """
 
+import os
+from functools import lru_cache
+from types import MappingProxyType
+
 # Stop detection parameters
 STOP_SPEED_THRESHOLD_KMH = 2.0  # km/h, speeds below this may be considered as stops
 STOP_DURATION_SECONDS = 5      # how long a stop must last to be considered valid
@@ -20,10 +24,21 @@ NP_WINDOW_SIZE_SECONDS = 30    # moving average window size for normalized power
 NP_EXPONENT = 4                # exponent to use in normalized power calculation
 MAX_POWER_THRESHOLD = 3000     # maximum reasonable power value (watts)
 
+# Visualization parameters
+CHART_MAX_POINTS = 2000        # maximum number of points drawn in timeline charts
+
+# Parallelism parameters
+PARALLEL_MIN_POINTS = 20_000   # rides longer than this run independent NumPy work in threads
+MAX_WORKERS = 4                # maximum number of worker threads (also capped by the CPU count)
+
+# Debugging parameters
+DEBUG = False                  # print a data overview when no cruising data is identified
+
 # The following functions can be used to create configuration objects for more flexible parameter handling
-def get_default_config():
-    """Returns a dictionary of default configuration parameters"""
-    return {
+@lru_cache(maxsize=1)
+def _default_config_frozen():
+    """Returns the default configuration parameters as a read-only mapping, built once"""
+    return MappingProxyType({
         'stop_speed_threshold_kmh': STOP_SPEED_THRESHOLD_KMH,
         'stop_duration_seconds': STOP_DURATION_SECONDS,
         'acceleration_threshold_mps2': ACCELERATION_THRESHOLD_MPS2,
@@ -33,8 +48,33 @@ def get_default_config():
         'speed_std_dev_threshold_factor': SPEED_STD_DEV_THRESHOLD_FACTOR,
         'np_window_size_seconds': NP_WINDOW_SIZE_SECONDS,
         'np_exponent': NP_EXPONENT,
-        'max_power_threshold': MAX_POWER_THRESHOLD
-    }
+        'max_power_threshold': MAX_POWER_THRESHOLD,
+        'debug': DEBUG
+    })
+
+def parallel_workers(n_points, max_tasks=None):
+    """
+    Number of threads to use for independent NumPy work over n_points
+
+    Rides longer than PARALLEL_MIN_POINTS are split across at most MAX_WORKERS
+    threads (also capped by the CPU count and max_tasks); anything else runs
+    sequentially.
+
+    Args:
+        n_points (int): Number of data points
+        max_tasks (int, optional): Number of independent tasks available
+
+    Returns:
+        int: Number of worker threads, 1 for sequential execution
+    """
+    workers = min(os.cpu_count() or 1, MAX_WORKERS)
+    if max_tasks is not None:
+        workers = min(workers, max_tasks)
+    return workers if n_points > PARALLEL_MIN_POINTS else 1
+
+def get_default_config():
+    """Returns a dictionary of default configuration parameters"""
+    return dict(_default_config_frozen())
 
 def merge_config(base_config, override_config=None):
     """
@@ -48,11 +88,7 @@ def merge_config(base_config, override_config=None):
         dict: Merged configuration
     """
     if override_config is None:
-        return base_config.copy()
-    
-    merged = base_config.copy()
-    for key, value in override_config.items():
-        # Update all keys from override_config, not just those in base_config
-        merged[key] = value
+        return {**base_config}
     
-    return merged
+    # Take all keys from override_config, not just those in base_config
+    return {**base_config, **override_config}
@@ -2,16 +2,18 @@
 Data models module: Defines core data structures
 """
 
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+# slots=True requires Python 3.10+ (see README / requirements.txt)
+@dataclass(slots=True)
 class Record:
-    """Data structure for a single record point"""
+    """Data structure for a single record point (slotted: no per-instance __dict__)"""
     timestamp: datetime
     speed: float  # m/s
 
@@ -32,65 +34,183 @@ class Record:
 
     def __getitem__(self, key):
         """Supports accessing fields like a dictionary"""
-        if hasattr(self, key):
+        if key in _RECORD_SLOTS:
             return getattr(self, key)
         return self.extra.get(key)
 
     def __setitem__(self, key, value):
         """Supports setting fields like a dictionary"""
-        if hasattr(self, key):
+        if key in _RECORD_SLOTS:
             setattr(self, key, value)
         else:
             self.extra[key] = value
 
 
-@dataclass
-class RideData:
-    """Collection of ride data"""
-    records: List[Record] = field(default_factory=list)
+# Names of the Record fields; any other column is an extra field
+_RECORD_FIELDS = tuple(f.name for f in fields(Record) if f.name != 'extra')
+_RECORD_FIELD_SET = frozenset(_RECORD_FIELDS)
+_RECORD_SLOTS = frozenset(Record.__slots__)
+# Default values of the optional Record fields
+_RECORD_DEFAULTS = {f.name: f.default for f in fields(Record) if f.default is not MISSING}
+# State flag fields, always stored as np.bool_ columns
+_RECORD_FLAGS = tuple(f.name for f in fields(Record) if f.type is bool)
 
-    def to_dataframe(self) -> pd.DataFrame:
-        """Converts records to a pandas DataFrame"""
-        records_dict = []
-        for record in self.records:
-            # Merge basic fields and extra fields
-            record_dict = {
-                k: v for k, v in record.__dict__.items()
-                if k != 'extra' and v is not None
-            }
-            record_dict.update(record.extra)
-            records_dict.append(record_dict)
-
-        return pd.DataFrame(records_dict)
 
-    @staticmethod
-    def from_dataframe(df: pd.DataFrame) -> 'RideData':
-        """Creates RideData from a pandas DataFrame"""
-        records = []
-        base_fields = {f.name for f in Record.__dataclass_fields__.values()}
+class RecordView:
+    """
+    Lightweight view of a single point of a RideData
+
+    Values are read from (and written to) the column arrays on demand, so
+    no Record object is built. Missing values read as None, like on Record.
+    """
+    __slots__ = ('_columns', '_index')
+
+    def __init__(self, ride_data: 'RideData', index: int):
+        object.__setattr__(self, '_columns', ride_data.columns)
+        object.__setattr__(self, '_index', index)
+
+    def __getitem__(self, key):
+        """Supports accessing fields like a dictionary"""
+        column = self._columns.get(key)
+        if column is None:
+            return _RECORD_DEFAULTS.get(key)
+        value = column[self._index]
+        if column.dtype.kind == 'f' and np.isnan(value):
+            return None
+        return value
 
-        for _, row in df.iterrows():
-            # Extract basic fields
-            kwargs = {
-                field: row[field]
-                for field in base_fields
-                if field in row and pd.notna(row[field])
-            }
+    def __setitem__(self, key, value):
+        """Supports setting fields like a dictionary (the column must exist)"""
+        column = self._columns[key]
+        if value is None:
+            # Only float columns can hold a missing value (NaN)
+            if column.dtype.kind != 'f':
+                raise TypeError(f"Cannot set '{key}' to None: column has dtype {column.dtype}")
+            value = np.nan
+        column[self._index] = value
+
+    def __getattr__(self, name):
+        """Reads a column, or the Record default of a field without a column"""
+        if name.startswith('_') or (name not in self._columns and name not in _RECORD_DEFAULTS):
+            raise AttributeError(f"'RecordView' object has no attribute '{name}'")
+        return self[name]
+
+    def __setattr__(self, name, value):
+        """Writes a column (the column must exist)"""
+        if name not in self._columns:
+            raise AttributeError(f"'RecordView' object has no column '{name}'")
+        self[name] = value
+
+    def __copy__(self):
+        """A copy is another view of the same point of the same columns"""
+        copied = object.__new__(RecordView)
+        object.__setattr__(copied, '_columns', self._columns)
+        object.__setattr__(copied, '_index', self._index)
+        return copied
+
+    def __reduce__(self):
+        """Pickles (and deep-copies) as a view over the column arrays"""
+        return RecordView, (RideData(columns=self._columns), self._index)
+
+    def __repr__(self):
+        return f"RecordView({self._index})"
+
+
+@dataclass(eq=False)
+class RideData:
+    """
+    Collection of ride data
+
+    Data is stored column-wise: one NumPy array per field, all of the same
+    length. Fields missing on every record have no column; missing values of
+    numeric fields are NaN.
+    """
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def records(self) -> List[Record]:
+        """Materializes the columns as Record objects (copies, changes are not written back)"""
+        df = self.to_dataframe()
+        base_cols = [col for col in df.columns if col in _RECORD_FIELD_SET]
+        extra_cols = [col for col in df.columns if col not in _RECORD_FIELD_SET]
+
+        # Box all values once and find missing ones in a single vectorized pass
+        base_arr = df[base_cols].to_numpy(dtype=object)
+        extra_arr = df[extra_cols].to_numpy(dtype=object)
+        base_valid = pd.notna(base_arr)
+        extra_valid = pd.notna(extra_arr)
 
-            # Extract extra fields
-            extra = {
-                col: row[col]
-                for col in row.index
-                if col not in base_fields and pd.notna(row[col])
-            }
+        records = []
+        for i in range(len(df)):
+            kwargs = {col: v for col, v, ok in zip(base_cols, base_arr[i], base_valid[i]) if ok}
+            extra = {col: v for col, v, ok in zip(extra_cols, extra_arr[i], extra_valid[i]) if ok}
+            records.append(Record(**kwargs, extra=extra))
+        return records
 
-            if 'extra' not in kwargs:
-                kwargs['extra'] = {}
-            kwargs['extra'].update(extra)
+    @staticmethod
+    def from_records(records: List[Record]) -> 'RideData':
+        """Creates RideData from a list of Record objects"""
+        # Fill one preallocated list per column instead of one dict per record
+        n = len(records)
+        values = {name: [None] * n for name in _RECORD_FIELDS}
+        for i, record in enumerate(records):
+            for name in _RECORD_FIELDS:
+                values[name][i] = getattr(record, name)
+            for key, value in record.extra.items():
+                if key not in values:
+                    values[key] = [None] * n
+                values[key][i] = value
+
+        # Fields that are None on every record get no column
+        values = {
+            col: column for col, column in values.items()
+            if col not in _RECORD_FIELD_SET or any(v is not None for v in column)
+        }
+
+        return RideData.from_dataframe(pd.DataFrame(values))
+
+    def as_arrays(self) -> Dict[str, np.ndarray]:
+        """Returns the columns as a dict of NumPy arrays (the arrays are not copied)"""
+        return dict(self.columns)
 
-            records.append(Record(**kwargs))
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Converts the columns to a pandas DataFrame
+
+        The DataFrame is built without copying, so it shares memory with this RideData.
+        """
+        return pd.DataFrame(self.columns, copy=False)
 
-        return RideData(records=records)
+    @staticmethod
+    def from_dataframe(df: pd.DataFrame) -> 'RideData':
+        """Creates RideData from a pandas DataFrame (the columns are copied)"""
+        # State flags are stored as 1-byte np.bool_, never as object arrays
+        # (e.g. from a nullable 'boolean' column); missing flags take the Record default
+        return RideData(columns={
+            col: df[col].to_numpy(dtype=bool, na_value=_RECORD_DEFAULTS[col], copy=True)
+            if col in _RECORD_FLAGS else df[col].to_numpy(copy=True)
+            for col in df.columns
+        })
+
+    def __getitem__(self, index: int) -> RecordView:
+        """Returns a view of the point at index, backed by the column arrays"""
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"RideData index out of range: {index}")
+        return RecordView(self, index % len(self))
+
+    def __eq__(self, other):
+        """Equal if both have the same columns with equal values (missing values compare equal)"""
+        if not isinstance(other, RideData):
+            return NotImplemented
+        return self.columns.keys() == other.columns.keys() and all(
+            np.array_equal(column, other.columns[col],
+                           equal_nan=column.dtype.kind in 'fcmM')
+            for col, column in self.columns.items()
+        )
+
+    def __reduce__(self):
+        """Pickles as the column arrays only, so protocol 5 can pass them as out-of-band buffers"""
+        return RideData, (self.columns,)
 
     def __len__(self):
-        return len(self.records)
\ No newline at end of file
+        return len(next(iter(self.columns.values()))) if self.columns else 0
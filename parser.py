@@ -2,11 +2,15 @@
 Parser module: Responsible for parsing FIT files into RideData
 """
 
-from typing import Optional
+import mmap
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
 
+import numpy as np
 from fitparse import FitFile
 
-from models import Record, RideData
+from models import RideData
 
 
 def get_field_value(record, field_name, default=None):
@@ -25,6 +29,28 @@ def get_field_value(record, field_name, default=None):
     return value if value is not None else default
 
 
+# Small integer FIT fields (W, rpm, bpm, °C): float32 stores them exactly, with NaN
+# for missing values, at half the memory of float64
+FLOAT32_FIELDS = frozenset({'power', 'cadence', 'heart_rate', 'temperature'})
+
+
+def _add_optional_columns(columns, field_values):
+    """
+    Add columns for optional fields.
+    
+    Args:
+        columns (dict): Columns to add to
+        field_values (dict): Field name to array('d') of values (NaN if missing)
+    """
+    for name, values in field_values.items():
+        # Wrap the buffer without copying; fields missing on every record get no column
+        column = np.frombuffer(values, dtype=np.float64)
+        if not np.isnan(column).all():
+            columns[name] = column.astype(
+                np.float32 if name in FLOAT32_FIELDS else np.float64, copy=False
+            )
+
+
 class FitParser:
     """FIT file parser class"""
     
@@ -34,7 +60,7 @@ class FitParser:
         Parse FIT binary data and return RideData object.
         
         Args:
-            fit_data (bytes): FIT file binary data
+            fit_data (bytes): FIT file binary data (or a readable file-like buffer, e.g. mmap)
             
         Returns:
             RideData: Contains all parsed riding records
@@ -45,44 +71,60 @@ class FitParser:
         except Exception as e:
             return None
         
-        records = []
+        # Column buffers, one per field; numeric fields go into unboxed
+        # array('d') buffers with NaN for missing values
+        timestamps = []
+        speeds = array('d')
+        optional_fields = {
+            name: array('d') for name in ('power', 'cadence', 'distance')
+        }
+        # Add extra fields (extensible)
+        # Examples: heart rate, altitude, temperature, grade, etc.
+        extra_fields = {
+            name: array('d') for name in ('heart_rate', 'altitude', 'temperature')
+        }
         
         # Iterate through all 'record' type messages
         for record_msg in fitfile.get_messages('record'):
+            # Read all fields of the message at once instead of one lookup per field
+            values = record_msg.get_values()
+            
             # Extract basic fields
-            timestamp = get_field_value(record_msg, 'timestamp')
+            timestamp = values.get('timestamp')
             
             # Use enhanced_speed if available, otherwise fall back to speed
-            speed = get_field_value(record_msg, 'enhanced_speed')
+            speed = values.get('enhanced_speed')
             if speed is None:
-                speed = get_field_value(record_msg, 'speed')
+                speed = values.get('speed')
             
             # Only process records with timestamp and speed
             if timestamp is not None and speed is not None:
-                record = Record(
-                    timestamp=timestamp,
-                    speed=speed,
-                    power=get_field_value(record_msg, 'power'),
-                    cadence=get_field_value(record_msg, 'cadence'),
-                    distance=get_field_value(record_msg, 'distance')
-                )
-                
-                # Add extra fields (extensible)
-                # Examples: heart rate, altitude, temperature, grade, etc.
-                extra_fields = {
-                    'heart_rate': get_field_value(record_msg, 'heart_rate'),
-                    'altitude': get_field_value(record_msg, 'altitude'),
-                    'temperature': get_field_value(record_msg, 'temperature')
-                }
-                # Filter out None values
-                record.extra.update({k: v for k, v in extra_fields.items() if v is not None})
-                
-                records.append(record)
+                timestamps.append(timestamp)
+                speeds.append(speed)
+                for fields in (optional_fields, extra_fields):
+                    for name, buffer in fields.items():
+                        value = values.get(name)
+                        buffer.append(np.nan if value is None else value)
         
-        if not records:
+        if not timestamps:
             return None
         
-        return RideData(records=records)
+        columns = {
+            'timestamp': np.array(timestamps, dtype='datetime64[ns]'),
+            'speed': np.frombuffer(speeds, dtype=np.float64),
+        }
+        _add_optional_columns(columns, optional_fields)
+        
+        # Record defaults for the state flags set during preprocessing
+        columns['is_stopped'] = np.zeros(len(timestamps), dtype=bool)
+        columns['is_cruising'] = np.ones(len(timestamps), dtype=bool)
+        
+        _add_optional_columns(columns, extra_fields)
+        
+        # Convert speed to km/h once at ingest (m/s → km/h)
+        columns['speed_kmh'] = columns['speed'] * 3.6
+        
+        return RideData(columns=columns)
 
 
 # Factory for supporting custom parser formats
@@ -121,10 +163,31 @@ def read_fit_file(file_path: str) -> Optional[RideData]:
         None: If reading or parsing fails
     """
     try:
-        with open(file_path, 'rb') as file:
-            fit_data = file.read()
-        
-        parser = FitParser()
-        return parser.parse_bytes(fit_data)
+        # Map the file instead of reading it into a bytes copy; FitFile reads
+        # from any file-like object, and parsing completes before the map is closed
+        with open(file_path, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as fit_data:
+            parser = FitParser()
+            return parser.parse_bytes(fit_data)
     except Exception as e:
         return None
+
+
+def read_fit_files(file_paths: List[str], max_workers: Optional[int] = None) -> List[Optional[RideData]]:
+    """
+    Read and parse several FIT files in parallel worker processes.
+    
+    Args:
+        file_paths (List[str]): FIT file paths
+        max_workers (int, optional): Number of worker processes, defaults to the CPU count
+        
+    Returns:
+        List[Optional[RideData]]: Parsed data for each path, in order (None where reading or parsing failed)
+    """
+    # Decoding is CPU-bound Python, so use processes rather than threads;
+    # a single file is not worth starting a pool for
+    if len(file_paths) <= 1:
+        return [read_fit_file(path) for path in file_paths]
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(read_fit_file, file_paths))
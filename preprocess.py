@@ -3,6 +3,7 @@ Preprocessing module: Provides a pluggable data preprocessing pipeline
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 import numpy as np
@@ -12,20 +13,109 @@ import config
 from models import RideData
 
 
+def _fill_from_next_valid(values: np.ndarray) -> np.ndarray:
+    """
+    Fill NaNs from the next valid value, then from the last one, then with 0
+
+    Single-gather equivalent of ``Series.bfill().ffill().fillna(0)``.
+
+    Args:
+        values (np.ndarray): Values with NaN gaps
+
+    Returns:
+        np.ndarray: Filled values
+    """
+    valid = ~np.isnan(values)
+    if not valid.any():
+        return np.zeros(len(values))
+
+    valid_indices = np.flatnonzero(valid)
+    first, last = valid_indices[0], valid_indices[-1]
+    if len(valid_indices) == last - first + 1:
+        # Only the edges are missing (the usual rolling-window case)
+        filled = values.copy()
+        filled[:first] = values[first]
+        filled[last + 1:] = values[last]
+        return filled
+
+    # Index of the next valid value (bfill), falling back to the last valid one (ffill)
+    n = len(values)
+    next_valid = np.minimum.accumulate(np.where(valid, np.arange(n), n)[::-1])[::-1]
+    next_valid[next_valid == n] = last
+    return values[next_valid]
+
+
+def _interpolate_gaps(values: np.ndarray, limit: int) -> np.ndarray:
+    """
+    Linearly interpolate NaN gaps, filling at most limit points after each valid value
+
+    Equivalent to ``Series.interpolate(method='linear', limit=limit)``: longer
+    gaps are only partly filled, leading NaNs are kept and trailing NaNs take
+    the last valid value.
+
+    Args:
+        values (np.ndarray): Values with NaN gaps
+        limit (int): Maximum number of consecutive NaNs to fill
+
+    Returns:
+        np.ndarray: Interpolated values
+    """
+    valid = ~np.isnan(values)
+    if valid.all() or not valid.any():
+        return values
+
+    positions = np.arange(len(values))
+    interpolated = np.interp(positions, positions[valid], values[valid])
+
+    # Distance from the previous valid point limits how far each gap is filled
+    last_valid = np.maximum.accumulate(np.where(valid, positions, -1))
+    fill = ~valid & (last_valid >= 0) & (positions - last_valid <= limit)
+    return np.where(valid | fill, interpolated, np.nan)
+
+
 class Processor(ABC):
     """Base data processor class, defines interface standards"""
 
+    def __init__(self, conf: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the processor
+
+        Args:
+            conf (Dict[str, Any], optional): Configuration parameters
+        """
+        self.conf = dict(conf) if conf else {}
+        self._resolve_config()
+
+    def configure(self, conf: Optional[Dict[str, Any]]) -> None:
+        """
+        Re-resolve configuration parameters when given a different configuration
+
+        Settings are compared by value, so changes to a reused conf dict take
+        effect; an empty (or None) conf keeps the settings resolved so far.
+
+        Args:
+            conf (Dict[str, Any], optional): Configuration parameters
+        """
+        if conf and conf != self.conf:
+            self.conf = dict(conf)
+            self._resolve_config()
+
+    def _resolve_config(self) -> None:
+        """Resolve configuration parameters, falling back to module defaults"""
+        pass
+
     @abstractmethod
-    def process(self, data: RideData, conf: Dict[str, Any]) -> RideData:
+    def process(self, df: pd.DataFrame, conf: Dict[str, Any]) -> pd.DataFrame:
         """
         Process data
 
         Args:
-            data (RideData): Data to be processed
-            conf (Dict[str, Any]): Configuration parameters
+            df (pd.DataFrame): Data to be processed
+            conf (Dict[str, Any]): Configuration parameters (empty to keep the
+                settings given to the constructor)
 
         Returns:
-            RideData: Processed data
+            pd.DataFrame: Processed data
         """
         pass
 
@@ -36,13 +126,18 @@ class Processor(ABC):
 
 
 class ConvertSpeedToKmh(Processor):
-    """Speed unit conversion processor: m/s → km/h"""
+    """
+    Speed unit conversion processor: m/s → km/h
+
+    Always recomputed from speed (a single vectorized multiply), so partially
+    missing or stale speed_kmh values, e.g. from RideData.from_records or edits
+    to speed, never reach later stages.
+    """
 
-    def process(self, data: RideData, conf: Dict[str, Any]) -> RideData:
+    def process(self, df: pd.DataFrame, conf: Dict[str, Any]) -> pd.DataFrame:
         """Convert speed from m/s to km/h"""
-        for record in data.records:
-            record.speed_kmh = record.speed * 3.6
-        return data
+        df['speed_kmh'] = df['speed'].to_numpy(dtype=np.float64) * 3.6
+        return df
 
     @property
     def description(self) -> str:
@@ -52,25 +147,50 @@ class ConvertSpeedToKmh(Processor):
 class SortAndCalculateTimeDiff(Processor):
     """Sort by time and calculate time differences"""
 
-    def process(self, data: RideData, conf: Dict[str, Any]) -> RideData:
+    def process(self, df: pd.DataFrame, conf: Dict[str, Any]) -> pd.DataFrame:
         """Sort by timestamp and calculate time differences between consecutive records"""
-        df = data.to_dataframe()
+        # Sort by timestamp; ride files are almost always recorded in order,
+        # so only reorder when the timestamps are not already non-decreasing
+        timestamps = df['timestamp'].to_numpy(dtype='datetime64[ns]')
+        if not (timestamps[1:] >= timestamps[:-1]).all():
+            order = np.argsort(timestamps, kind='stable')
+            df = df.iloc[order]
+        if not df.index.equals(pd.RangeIndex(len(df))):
+            df = df.reset_index(drop=True)
+
+        # Calculate time difference (seconds) directly on the datetime64 values
+        timestamps = df['timestamp'].to_numpy(dtype='datetime64[ns]')
+        time_diff = np.empty(len(timestamps))
+        time_diff[:1] = np.nan
+        time_diff[1:] = np.diff(timestamps) / np.timedelta64(1, 's')
+
+        diffs = time_diff[1:]
+        if len(diffs) and diffs.min() == diffs.max():
+            # Fixed sampling interval (e.g. 1 Hz recording): the interval is the
+            # median, and no time difference is missing
+            time_diff[0] = diffs[0] if diffs[0] > 0 else 1.0
+            cumulative_time = np.cumsum(time_diff)
+            mean_time_diff = float(time_diff.mean())
+        else:
+            # Handle NaN for the first row's time difference
+            if len(diffs):
+                known_diffs = diffs[~np.isnan(diffs)]
+                common_diff = np.median(known_diffs) if len(known_diffs) else np.nan
+                time_diff[0] = common_diff if common_diff > 0 else 1.0
 
-        # Sort by timestamp
-        df = df.sort_values(by='timestamp').reset_index(drop=True)
+            # Calculate cumulative time (0 where the time difference is missing)
+            missing = np.isnan(time_diff)
+            cumulative_time = np.nancumsum(time_diff)
+            cumulative_time[missing] = 0
+            mean_time_diff = float(time_diff[~missing].mean()) if not missing.all() else np.nan
 
-        # Calculate time difference (seconds)
-        df['time_diff_seconds'] = df['timestamp'].diff().dt.total_seconds()
+        df['time_diff_seconds'] = time_diff
+        df['cumulative_time_seconds'] = cumulative_time
 
-        # Handle NaN for the first row's time difference
-        if len(df) > 1 and pd.isna(df.loc[0, 'time_diff_seconds']):
-            common_diff = df['time_diff_seconds'].median()
-            df.loc[0, 'time_diff_seconds'] = common_diff if pd.notna(common_diff) and common_diff > 0 else 1.0
+        # Cache the mean sampling interval for later stages
+        df.attrs['mean_time_diff'] = mean_time_diff
 
-        # Calculate cumulative time
-        df['cumulative_time_seconds'] = df['time_diff_seconds'].cumsum().fillna(0)
-
-        return RideData.from_dataframe(df)
+        return df
 
     @property
     def description(self) -> str:
@@ -80,54 +200,44 @@ class SortAndCalculateTimeDiff(Processor):
 class MarkStops(Processor):
     """Mark stop points"""
 
-    def process(self, data: RideData, conf: Dict[str, Any]) -> RideData:
-        """Mark stop points based on speed, cadence, power, etc."""
-        df = data.to_dataframe()
+    def _resolve_config(self) -> None:
+        """Resolve configuration parameters, falling back to module defaults"""
+        self.stop_speed_threshold = self.conf.get('stop_speed_threshold_kmh',
+                                                  config.STOP_SPEED_THRESHOLD_KMH)
+        self.stop_duration_seconds = self.conf.get('stop_duration_seconds',
+                                                   config.STOP_DURATION_SECONDS)
 
-        # Get configuration parameters
-        stop_speed_threshold = conf.get('stop_speed_threshold_kmh',
-                                      config.STOP_SPEED_THRESHOLD_KMH)
-        stop_duration_seconds = conf.get('stop_duration_seconds',
-                                       config.STOP_DURATION_SECONDS)
+    def process(self, df: pd.DataFrame, conf: Dict[str, Any]) -> pd.DataFrame:
+        """Mark stop points based on speed, cadence, power, etc."""
+        self.configure(conf)
 
         # Mark points with speed below threshold
-        df['is_stopped'] = (df['speed_kmh'] < stop_speed_threshold)
-
-        # If cadence data exists, also mark points with low cadence as stopped
-        if 'cadence' in df.columns and df['cadence'].notna().any():
-            df['is_stopped'] = df['is_stopped'] & (df['cadence'].fillna(1000) < 10)
-
-        # If power data exists, also mark points with low power as stopped
-        if 'power' in df.columns and df['power'].notna().any():
-            df['is_stopped'] = df['is_stopped'] & (df['power'].fillna(1000) < 30)
-
-        # Default all points are in cruising state
-        df['is_cruising'] = True
-
-        # Process continuous stops
-        stop_event_active = False
-        current_stop_duration = 0
-        stop_start_index = -1
-
-        for i in range(len(df)):
-            if df.loc[i, 'is_stopped']:
-                if not stop_event_active:
-                    stop_event_active = True
-                    stop_start_index = i
-                    current_stop_duration = float(df.loc[i, 'time_diff_seconds']) if pd.notna(df.loc[i, 'time_diff_seconds']) else 0.0
-                else:
-                    current_stop_duration += float(df.loc[i, 'time_diff_seconds']) if pd.notna(df.loc[i, 'time_diff_seconds']) else 0.0
-
-                if current_stop_duration >= stop_duration_seconds:
-                    # Mark the entire stop period as non-cruising
-                    df.loc[stop_start_index:i, 'is_cruising'] = False
-            else:
-                if stop_event_active:
-                    stop_event_active = False
-                    current_stop_duration = 0
-                    stop_start_index = -1
+        stopped = df['speed_kmh'].to_numpy() < self.stop_speed_threshold
+
+        # If cadence / power data exists, also require low cadence / power
+        # (missing values never count as low)
+        for column, low_threshold in (('cadence', 10), ('power', 30)):
+            if column in df.columns:
+                values = df[column].to_numpy(dtype=np.float64)
+                if not np.isnan(values).all():
+                    stopped &= values < low_threshold
+
+        # Process continuous stops: a run of stopped points lasting at least
+        # stop_duration_seconds is marked non-cruising as a whole, every
+        # other point is cruising
+        if stopped.any():
+            time_diff = np.nan_to_num(df['time_diff_seconds'].to_numpy(dtype=np.float64))
+            run_starts = stopped & ~np.concatenate(([False], stopped[:-1]))
+            run_ids = np.cumsum(run_starts)
+            run_durations = np.bincount(run_ids[stopped], weights=time_diff[stopped])
+            cruising = ~(stopped & (run_durations[run_ids] >= self.stop_duration_seconds))
+        else:
+            cruising = np.ones(len(df), dtype=bool)
 
-        return RideData.from_dataframe(df)
+        df['is_stopped'] = stopped
+        df['is_cruising'] = cruising
+
+        return df
 
     @property
     def description(self) -> str:
@@ -137,25 +247,21 @@ class MarkStops(Processor):
 class CalculateAcceleration(Processor):
     """Calculate Acceleration"""
 
-    def process(self, data: RideData, conf: Dict[str, Any]) -> RideData:
+    def process(self, df: pd.DataFrame, conf: Dict[str, Any]) -> pd.DataFrame:
         """Calculate acceleration and mark points with significant changes"""
-        df = data.to_dataframe()
-
         # Calculate speed difference (m/s)
         df['speed_diff_mps'] = df['speed'].diff().fillna(0)
 
-        # Calculate acceleration (m/s²)
-        df['acceleration'] = df.apply(
-            lambda row: row['speed_diff_mps'] / row['time_diff_seconds']
-            if pd.notna(row['time_diff_seconds']) and row['time_diff_seconds'] > 0 else 0,
-            axis=1
+        # Calculate acceleration (m/s²), 0 where the time difference is missing or not positive
+        speed_diff = df['speed_diff_mps'].to_numpy(dtype=np.float64)
+        time_diff = df['time_diff_seconds'].to_numpy(dtype=np.float64)
+        df['acceleration'] = np.divide(
+            speed_diff, time_diff,
+            out=np.zeros_like(speed_diff),
+            where=time_diff > 0
         )
 
-        # Handle potential NaN and infinite values
-        df['acceleration'] = df['acceleration'].fillna(0)
-        df['acceleration'] = df['acceleration'].replace([float('inf'), float('-inf')], 0)
-
-        return RideData.from_dataframe(df)
+        return df
 
     @property
     def description(self) -> str:
@@ -165,28 +271,34 @@ class CalculateAcceleration(Processor):
 class CalculateSpeedVariability(Processor):
     """Calculate Speed Variability"""
 
-    def process(self, data: RideData, conf: Dict[str, Any]) -> RideData:
-        """Calculate rolling standard deviation of speed"""
-        df = data.to_dataframe()
+    def _resolve_config(self) -> None:
+        """Resolve configuration parameters, falling back to module defaults"""
+        self.rolling_window_speed_std = self.conf.get('rolling_window_speed_std',
+                                                      config.ROLLING_WINDOW_SPEED_STD)
 
-        # Get configuration parameters
-        rolling_window_speed_std = conf.get('rolling_window_speed_std',
-                                         config.ROLLING_WINDOW_SPEED_STD)
+    def process(self, df: pd.DataFrame, conf: Dict[str, Any]) -> pd.DataFrame:
+        """Calculate rolling standard deviation of speed"""
+        self.configure(conf)
 
         # Ensure window size is an integer and at least 1
-        mean_time_diff = df['time_diff_seconds'].mean()
+        mean_time_diff = df.attrs.get('mean_time_diff')
+        if mean_time_diff is None:
+            mean_time_diff = df['time_diff_seconds'].mean()
         if pd.isna(mean_time_diff) or mean_time_diff <= 0:
             mean_time_diff = 1.0  # fallback value
 
-        window_size_points_std = max(1, int(rolling_window_speed_std / mean_time_diff))
+        window_size_points_std = max(1, int(self.rolling_window_speed_std / mean_time_diff))
 
         # Calculate rolling standard deviation of speed
-        df['speed_rolling_std_kmh'] = df['speed_kmh'].rolling(
+        # (pandas' compiled rolling kernel; incomplete edge windows are then
+        # filled from the nearest complete one in a single pass)
+        rolling_std = df['speed_kmh'].rolling(
             window=window_size_points_std,
             center=True
-        ).std().bfill().ffill().fillna(0)
+        ).std()
+        df['speed_rolling_std_kmh'] = _fill_from_next_valid(rolling_std.to_numpy())
 
-        return RideData.from_dataframe(df)
+        return df
 
     @property
     def description(self) -> str:
@@ -196,39 +308,46 @@ class CalculateSpeedVariability(Processor):
 class MarkNonCruising(Processor):
     """Mark Non-Cruising Status"""
 
-    def process(self, data: RideData, conf: Dict[str, Any]) -> RideData:
+    def _resolve_config(self) -> None:
+        """Resolve configuration parameters, falling back to module defaults"""
+        self.acceleration_threshold = self.conf.get('acceleration_threshold_mps2',
+                                                    config.ACCELERATION_THRESHOLD_MPS2)
+        self.speed_std_dev_factor = self.conf.get('speed_std_dev_threshold_factor',
+                                                  config.SPEED_STD_DEV_THRESHOLD_FACTOR)
+        self.min_cruising_speed = self.conf.get('min_cruising_speed_kmh',
+                                                config.MIN_CRUISING_SPEED_KMH)
+
+    def process(self, df: pd.DataFrame, conf: Dict[str, Any]) -> pd.DataFrame:
         """Mark non-cruising status based on acceleration and speed variability"""
-        df = data.to_dataframe()
+        self.configure(conf)
 
-        # Get configuration parameters
-        acceleration_threshold = conf.get('acceleration_threshold_mps2',
-                                       config.ACCELERATION_THRESHOLD_MPS2)
-        speed_std_dev_factor = conf.get('speed_std_dev_threshold_factor',
-                                      config.SPEED_STD_DEV_THRESHOLD_FACTOR)
-        min_cruising_speed = conf.get('min_cruising_speed_kmh',
-                                    config.MIN_CRUISING_SPEED_KMH)
+        # Read-only view of the stop marks; the result is built from it in a single AND
+        cruising = df['is_cruising'].to_numpy(dtype=bool)
+        rolling_std = df['speed_rolling_std_kmh'].to_numpy(dtype=np.float64)
 
         # Calculate average speed standard deviation for points currently marked as cruising
-        if df['is_cruising'].sum() > 0:
-            avg_speed_std_cruising = df.loc[df['is_cruising'], 'speed_rolling_std_kmh'].mean()
-        else:
-            avg_speed_std_cruising = df['speed_rolling_std_kmh'].mean()  # fallback value when no cruising points
+        # (fallback to all points when there are no cruising points)
+        reference_std = rolling_std[cruising] if cruising.any() else rolling_std
+        reference_std = reference_std[~np.isnan(reference_std)]
+        avg_speed_std_cruising = reference_std.mean() if len(reference_std) else np.nan
 
         if pd.isna(avg_speed_std_cruising):
             avg_speed_std_cruising = 0.5  # absolute fallback value
 
         # Mark non-cruising based on acceleration
-        df.loc[abs(df['acceleration']) > acceleration_threshold, 'is_cruising'] = False
+        non_cruising = np.abs(df['acceleration'].to_numpy(dtype=np.float64)) > self.acceleration_threshold
 
         # Mark non-cruising based on speed variability
         # Ensure avg_speed_std_cruising is a reasonable positive value
-        threshold_std_dev = avg_speed_std_cruising * speed_std_dev_factor if avg_speed_std_cruising > 0.01 else speed_std_dev_factor
-        df.loc[df['speed_rolling_std_kmh'] > threshold_std_dev, 'is_cruising'] = False
+        threshold_std_dev = avg_speed_std_cruising * self.speed_std_dev_factor if avg_speed_std_cruising > 0.01 else self.speed_std_dev_factor
+        non_cruising |= rolling_std > threshold_std_dev
 
         # Exclude points below minimum cruising speed
-        df.loc[df['speed_kmh'] < min_cruising_speed, 'is_cruising'] = False
+        non_cruising |= df['speed_kmh'].to_numpy(dtype=np.float64) < self.min_cruising_speed
 
-        return RideData.from_dataframe(df)
+        df['is_cruising'] = cruising & ~non_cruising
+
+        return df
 
     @property
     def description(self) -> str:
@@ -238,34 +357,98 @@ class MarkNonCruising(Processor):
 class ValidatePowerData(Processor):
     """Power data validation processor"""
 
-    def process(self, data: RideData, conf: Dict[str, Any]) -> RideData:
+    def _resolve_config(self) -> None:
+        """Resolve configuration parameters, falling back to module defaults"""
+        self.max_power_threshold = self.conf.get('max_power_threshold', config.MAX_POWER_THRESHOLD)
+        self.interpolate_gaps = self.conf.get('interpolate_power_gaps', True)
+        self.max_gap_size = self.conf.get('max_power_gap_seconds', 5)
+
+    def process(self, df: pd.DataFrame, conf: Dict[str, Any]) -> pd.DataFrame:
         """Validate and clean power data"""
-        df = data.to_dataframe()
-        
+        self.configure(conf)
+
         # Skip if no power data
         if 'power' not in df.columns:
-            return data
+            return df
             
+        power = df['power'].to_numpy(dtype=np.float64, copy=True)
+
         # Remove negative power values
-        df.loc[df['power'] < 0, 'power'] = 0
+        power[power < 0] = 0
         
         # Remove unreasonably high power values (e.g. spikes)
-        max_power_threshold = conf.get('max_power_threshold', config.MAX_POWER_THRESHOLD)
-        df.loc[df['power'] > max_power_threshold, 'power'] = np.nan
+        power[power > self.max_power_threshold] = np.nan
         
         # Optional: Interpolate small gaps in power data
-        if conf.get('interpolate_power_gaps', True):
-            gap_size = conf.get('max_power_gap_seconds', 5)
-            # Use simple linear interpolation as it doesn't require DatetimeIndex
-            df['power'] = df['power'].interpolate(method='linear', limit=gap_size)
+        if self.interpolate_gaps:
+            # Use simple linear interpolation over point positions (no DatetimeIndex needed)
+            power = _interpolate_gaps(power, self.max_gap_size)
+        
+        # Keep float32 storage (from the parser); any other input, including
+        # integer watts, stays float64 so NaN gaps and interpolated values survive
+        if df['power'].dtype == np.float32:
+            power = power.astype(np.float32)
+        df['power'] = power
             
-        return RideData.from_dataframe(df)
+        return df
 
     @property
     def description(self) -> str:
         return "Validates and cleans power data"
 
 
+class ConcurrentProcessors(Processor):
+    """
+    Runs data-independent processors side by side
+
+    The processors must only read columns none of the others write. Long
+    rides run them in threads, each on its own shallow copy of the DataFrame;
+    the columns (and attrs) each one adds or replaces are then merged back in
+    processor order, so the result matches running them one after another.
+    """
+
+    def __init__(self, processors: List[Processor], conf: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the processor group
+
+        Args:
+            processors (List[Processor]): Independent processors
+            conf (Dict[str, Any], optional): Configuration parameters
+        """
+        self.processors = processors
+        super().__init__(conf)
+
+    def process(self, df: pd.DataFrame, conf: Dict[str, Any]) -> pd.DataFrame:
+        """Run the processors and merge their output columns"""
+        workers = config.parallel_workers(len(df), len(self.processors))
+        if workers <= 1:
+            # Short rides / single CPU: chain the processors directly
+            for processor in self.processors:
+                df = processor.process(df, conf)
+            return df
+
+        # Long rides: NumPy and pandas' rolling kernels release the GIL
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                lambda processor: processor.process(df.copy(deep=False), conf),
+                self.processors
+            ))
+
+        for result in results:
+            for col in result.columns:
+                # Unchanged columns still share memory with the input
+                if col not in df.columns or not np.may_share_memory(
+                        result[col].to_numpy(), df[col].to_numpy()):
+                    df[col] = result[col]
+            df.attrs.update(result.attrs)
+
+        return df
+
+    @property
+    def description(self) -> str:
+        return " + ".join(processor.description for processor in self.processors)
+
+
 class PreProcessingPipeline:
     """Data preprocessing pipeline"""
 
@@ -297,29 +480,43 @@ class PreProcessingPipeline:
 
         Args:
             data (RideData): Raw data
-            conf (Dict[str, Any], optional): Configuration parameters
+            conf (Dict[str, Any], optional): Configuration parameters; if omitted,
+                each processor keeps the settings it was created with
 
         Returns:
             RideData: Processed data
         """
         if conf is None:
-            conf = config.get_default_config()
+            conf = {}
 
-        result = data
+        # Convert once and pass the same DataFrame through every stage
+        df = data.to_dataframe()
         for processor in self.processors:
-            result = processor.process(result, conf)
+            df = processor.process(df, conf)
 
-        return result
+        return RideData.from_dataframe(df)
 
     @staticmethod
-    def create_default_pipeline() -> 'PreProcessingPipeline':
-        """Create default preprocessing pipeline"""
+    def create_default_pipeline(conf: Optional[Dict[str, Any]] = None) -> 'PreProcessingPipeline':
+        """
+        Create default preprocessing pipeline
+
+        Args:
+            conf (Dict[str, Any], optional): Configuration parameters, resolved once
+                by each processor; process() only re-resolves them when given a
+                different non-empty configuration
+
+        Returns:
+            PreProcessingPipeline: Default pipeline
+        """
         return PreProcessingPipeline([
-            ConvertSpeedToKmh(),
-            SortAndCalculateTimeDiff(),
-            ValidatePowerData(),
-            MarkStops(),
-            CalculateAcceleration(),
-            CalculateSpeedVariability(),
-            MarkNonCruising()
+            ConvertSpeedToKmh(conf),
+            SortAndCalculateTimeDiff(conf),
+            ValidatePowerData(conf),
+            MarkStops(conf),
+            ConcurrentProcessors([
+                CalculateAcceleration(conf),
+                CalculateSpeedVariability(conf),
+            ]),
+            MarkNonCruising(conf)
         ])
\ No newline at end of file
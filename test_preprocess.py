@@ -0,0 +1,53 @@
+"""
+Tests for the preprocessing pipeline configuration
+"""
+
+import numpy as np
+
+from models import RideData
+from preprocess import MarkNonCruising, PreProcessingPipeline
+
+
+def _make_ride(n=120):
+    """Steady ride at 8.5 m/s (30.6 km/h), sampled at 1 Hz"""
+    timestamps = np.datetime64('2024-01-01T08:00:00', 'ns') + np.arange(n) * np.timedelta64(1, 's')
+    speed = np.full(n, 8.5)
+    return RideData(columns={
+        'timestamp': timestamps,
+        'speed': speed,
+        'is_stopped': np.zeros(n, dtype=bool),
+        'is_cruising': np.ones(n, dtype=bool),
+        'speed_kmh': speed * 3.6,
+    })
+
+
+def test_default_pipeline_cruises_steady_ride():
+    result = PreProcessingPipeline.create_default_pipeline().process(_make_ride())
+    assert result.columns['is_cruising'].all()
+
+
+def test_pipeline_keeps_constructor_config_without_process_conf():
+    pipeline = PreProcessingPipeline.create_default_pipeline({'min_cruising_speed_kmh': 40.0})
+    result = pipeline.process(_make_ride())
+    assert not result.columns['is_cruising'].any()
+
+
+def test_processor_keeps_constructor_config_with_empty_conf():
+    df = _make_ride().to_dataframe()
+    df['acceleration'] = 0.0
+    df['speed_rolling_std_kmh'] = 0.0
+
+    processor = MarkNonCruising({'min_cruising_speed_kmh': 40.0})
+    df = processor.process(df, {})
+    assert processor.min_cruising_speed == 40.0
+    assert not df['is_cruising'].any()
+
+
+def test_reused_conf_changes_take_effect():
+    ride = _make_ride()
+    conf = {'min_cruising_speed_kmh': 10.0}
+    pipeline = PreProcessingPipeline.create_default_pipeline(conf)
+    assert pipeline.process(ride, conf).columns['is_cruising'].all()
+
+    conf['min_cruising_speed_kmh'] = 40.0
+    assert not pipeline.process(ride, conf).columns['is_cruising'].any()
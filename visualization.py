@@ -2,12 +2,110 @@
 Visualization module: Provides data visualization functionality
 """
 
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Select points with the Largest-Triangle-Three-Buckets algorithm
+    
+    Keeps the first and last point and, from each of max_points - 2 equal
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the average of the next bucket. Unlike a
+    uniform stride, this preserves peaks and dips of the curve.
+    
+    Args:
+        x (np.ndarray): X values (increasing)
+        y (np.ndarray): Y values (NaN is treated as 0 when choosing points)
+        max_points (int): Number of points to keep
+        
+    Returns:
+        np.ndarray: Sorted indices of the kept points
+    """
+    n = len(x)
+    if n <= max_points or max_points < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=np.float64)
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    
+    indices = np.empty(max_points, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    previous = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket (the last point for the final bucket)
+        if i + 2 < len(edges):
+            next_x = x[end:edges[i + 2]].mean()
+            next_y = y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        
+        # Twice the triangle area for every candidate of this bucket
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        indices[i + 1] = previous
+    
+    return indices
+
+
+def downsample(df: pd.DataFrame, max_points: int, column: Optional[str] = None) -> pd.DataFrame:
+    """
+    Downsample a DataFrame for plotting
+    
+    Args:
+        df (pd.DataFrame): DataFrame to downsample
+        max_points (int): Maximum number of rows to keep
+        column (str, optional): Column whose shape to preserve against the
+            timestamps (LTTB); every n-th row is kept when omitted or missing
+        
+    Returns:
+        pd.DataFrame: df itself if it is small enough, otherwise the selected rows
+    """
+    if len(df) <= max_points:
+        return df
+    if column is not None and column in df.columns:
+        timestamps = df['timestamp'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+        return df.iloc[lttb_indices(timestamps, df[column].to_numpy(), max_points)]
+    step = -(-len(df) // max_points)  # ceiling division
+    return df.iloc[::step]
+
+
+def histogram_bar(values, bins: int = 30, **trace_kwargs) -> go.Bar:
+    """
+    Bin values with NumPy and return them as a bar trace
+    
+    Only the bin counts are sent to the browser, instead of every raw
+    value for plotly to bin client-side.
+    
+    Args:
+        values: Values to bin (NaN values are ignored)
+        bins (int): Number of equal-width bins
+        **trace_kwargs: Extra go.Bar arguments (name, marker_color, ...)
+        
+    Returns:
+        plotly.graph_objects.Bar: Histogram bars
+    """
+    values = np.asarray(values, dtype=np.float64)
+    counts, edges = np.histogram(values[~np.isnan(values)], bins=bins)
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        **trace_kwargs
+    )
+
+
 def create_speed_time_chart(df: pd.DataFrame) -> go.Figure:
     """
     Create speed-time curve chart
@@ -21,11 +119,11 @@ def create_speed_time_chart(df: pd.DataFrame) -> go.Figure:
     # Create chart
     fig = px.line(df, x='timestamp', y='speed_kmh')
     
-    # Add cruising section highlighting
-    cruising_df = df[df['is_cruising']]
+    # Add cruising section highlighting (only the two plotted columns are subset)
+    cruising = df['is_cruising'].to_numpy(dtype=bool)
     fig.add_scatter(
-        x=cruising_df['timestamp'], 
-        y=cruising_df['speed_kmh'],
+        x=df['timestamp'].to_numpy()[cruising], 
+        y=df['speed_kmh'].to_numpy()[cruising],
         mode='markers',
         marker=dict(color='green', size=5),
         name='Cruising'
@@ -58,9 +156,9 @@ def create_speed_distribution(df: pd.DataFrame) -> go.Figure:
     
     # Speed distribution of all data
     fig.add_trace(
-        go.Histogram(
-            x=df['speed_kmh'],
-            nbinsx=30,
+        histogram_bar(
+            df['speed_kmh'].to_numpy(),
+            bins=30,
             name='All',
             marker_color='blue',
             opacity=0.7
@@ -70,9 +168,9 @@ def create_speed_distribution(df: pd.DataFrame) -> go.Figure:
     
     # Speed distribution of cruising sections only
     fig.add_trace(
-        go.Histogram(
-            x=df[df['is_cruising']]['speed_kmh'],
-            nbinsx=30,
+        histogram_bar(
+            df['speed_kmh'].to_numpy()[df['is_cruising'].to_numpy(dtype=bool)],
+            bins=30,
             name='Cruising',
             marker_color='green',
             opacity=0.7
@@ -115,10 +213,11 @@ def create_summary_charts(df: pd.DataFrame, result: dict) -> go.Figure:
     )
     
     # Add cruising ratio pie chart
+    cruising_points = int(df['is_cruising'].to_numpy(dtype=bool).sum())
     fig.add_trace(
         go.Pie(
             labels=['Cruising', 'Non-Cruising'],
-            values=[df['is_cruising'].sum(), len(df) - df['is_cruising'].sum()],
+            values=[cruising_points, len(df) - cruising_points],
             marker_colors=['green', 'red']
         ),
         row=1, col=1
@@ -257,9 +356,9 @@ def create_power_distribution(df: pd.DataFrame, result: dict) -> go.Figure:
     
     # Power distribution histogram
     fig.add_trace(
-        go.Histogram(
-            x=df['power'],
-            nbinsx=30,
+        histogram_bar(
+            df['power'].to_numpy(),
+            bins=30,
             name='Power',
             marker_color='blue',
             opacity=0.7